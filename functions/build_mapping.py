@@ -0,0 +1,23 @@
+"""• Build status_mapping.json from status_mapping.yaml
+----------------------------------------------------------------
+main.py reads the JSON copy so cold starts skip the pure-Python YAML parser.
+Runs automatically as a Firebase predeploy hook; run it by hand after editing
+status_mapping.yaml when testing locally:
+
+    python build_mapping.py
+"""
+import os, json, yaml
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+
+def main():
+    with open(os.path.join(ROOT, "status_mapping.yaml"), "rt", encoding="utf8") as f:
+        mapping = yaml.safe_load(f)
+    with open(os.path.join(ROOT, "status_mapping.json"), "wt", encoding="utf8") as f:
+        json.dump(mapping, f, indent=2)
+        f.write("\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -11,37 +11,51 @@ Deploy (Gen‑2):
     firebase deploy --only functions
 """
 from __future__ import annotations
-import os, json, hmac, hashlib, yaml, logging
-from datetime import datetime, timezone
-from typing import List, Dict, Any, Optional
+import os, json, hmac, orjson, logging, calendar, socket, atexit, time, threading
+from datetime import datetime
+from typing import List, Dict, Any, Optional, Tuple
 import shotgun_api3
+from cachetools import TTLCache
+try:
+    from shotgun_api3.lib import httplib2  # shotgun_api3's transport; load it at cold start
+except ImportError:
+    httplib2 = None
 import functions_framework            # local dev convenience
-from firebase_functions import https_fn  # GCF/Firebase runtime
-from flask import Request, abort, make_response, jsonify
+from firebase_functions import https_fn, options  # GCF/Firebase runtime
+from flask import Request, Response, abort, make_response
 
 # ─────────────────────────────── Standard Python Logging ────────────────────────
 # Set up a logger with a name in Firebase Functions
 logger = logging.getLogger("shotgrid-webhooks")
 
-# Configure the logger
-formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+class _JsonFormatter(logging.Formatter):
+    """One JSON line per record; Cloud Logging reads `severity` and `message` natively."""
+    def format(self, record: logging.LogRecord) -> str:
+        message = record.getMessage()
+        if record.exc_info:
+            message = f"{message}\n{self.formatException(record.exc_info)}"
+        return orjson.dumps({"severity": record.levelname, "message": message, "logger": record.name}).decode()
 
-# Configure the handler (Firebase Functions automatically captures stdout/stderr)
-handler = logging.StreamHandler()
-handler.setFormatter(formatter)
+# Only configure once, even if the module is imported again in the same process
+if not logger.handlers:
+    # Firebase Functions automatically captures stdout/stderr
+    handler = logging.StreamHandler()
+    handler.setFormatter(_JsonFormatter())
+    logger.addHandler(handler)
 
-# Add the handler to the logger
-logger.addHandler(handler)
+    # Don't hand records on to any root handler the framework installs as well
+    logger.propagate = False
 
-# Set the logging level
-logger.setLevel(logging.INFO)
+    # Set the logging level
+    logger.setLevel(logging.INFO)
 
 # ─────────────────────────────── Configuration ──────────────────────────────
 ROOT = os.path.dirname(__file__)
 with open(os.path.join(ROOT, "config.json"), "rt", encoding="utf8") as f:
     _CONF = json.load(f)
-with open(os.path.join(ROOT, "status_mapping.yaml"), "rt", encoding="utf8") as f:
-    _MAP = yaml.safe_load(f)
+# Generated from status_mapping.yaml by build_mapping.py (Firebase predeploy)
+with open(os.path.join(ROOT, "status_mapping.json"), "rb") as f:
+    _MAP = orjson.loads(f.read())
 
 SG_HOST        = _CONF["SHOTGRID_URL"]
 SG_API_KEY     = _CONF["SHOTGRID_API_KEY"]
@@ -49,152 +63,286 @@ SG_SCRIPT_NAME = _CONF["SHOTGRID_SCRIPT_NAME"]
 SECRET_TOKEN   = _CONF["SECRET_TOKEN"].encode()
 
 logger.info("Starting ShotGrid webhooks service")
-logger.info(f"Using ShotGrid host: {SG_HOST}")
-logger.info(f"Using script name: {SG_SCRIPT_NAME}")
+logger.info("Using ShotGrid host: %s", SG_HOST)
+logger.info("Using script name: %s", SG_SCRIPT_NAME)
+
+# ─────────────────────────────── TCP keep-alive ─────────────────────────────
+# shotgun_api3 talks to ShotGrid through its bundled httplib2, which re-uses one
+# HTTPS connection per client. Enable TCP keep-alive on that socket so an idle
+# warm container does not have its connection silently dropped and pay a fresh
+# TLS handshake on the next webhook.
+_KEEPIDLE_SECS = 30
+
+
+def _enable_keepalive(sock: socket.socket) -> None:
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+    if hasattr(socket, "TCP_KEEPIDLE"):
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, _KEEPIDLE_SECS)
+
+
+def _patch_keepalive():
+    # These are vendored internals; if a shotgun_api3 release moves them, run
+    # without keep-alive rather than fail the import.
+    conn_classes = [getattr(httplib2, name, None)
+                    for name in ("HTTPConnectionWithTimeout", "HTTPSConnectionWithTimeout")]
+    if None in conn_classes:
+        logger.warning("shotgun_api3 httplib2 transport not found, TCP keep-alive not enabled")
+        return
+
+    for conn_cls in conn_classes:
+        orig_connect = conn_cls.connect
+
+        def connect(self, _orig=orig_connect):
+            _orig(self)
+            if self.sock is not None:
+                _enable_keepalive(self.sock)
+
+        conn_cls.connect = connect
+
+_patch_keepalive()
 
 # ─────────────────────────────── Singleton SG client ────────────────────────
 logger.info("Initializing ShotGrid client connection")
 try:
+    # The capability probe connect=True would run here happens in _warm_up
+    # instead, off the import path.
     _SG_CLIENT = shotgun_api3.Shotgun(
         SG_HOST,
         script_name=SG_SCRIPT_NAME,
         api_key=SG_API_KEY,
-        connect=True,
+        connect=False,
     )
-    logger.info("ShotGrid client connection successful")
-except Exception as e:
-    logger.error(f"Failed to initialize ShotGrid client: {str(e)}")
+    # Webhooks are latency-sensitive; retry failed RPCs immediately instead of
+    # sleeping between attempts.
+    _SG_CLIENT.config.rpc_attempt_interval = 0
+
+    logger.info("ShotGrid client created")
+except Exception:
+    logger.exception("Failed to initialize ShotGrid client")
     raise
 
+atexit.register(_SG_CLIENT.close)
+
+
+def _warm_up():
+    """Open the TLS session to ShotGrid so the first webhook doesn't pay for it."""
+    try:
+        # One info() request: negotiates server capabilities and opens the
+        # kept-alive connection.
+        _SG_CLIENT.server_caps
+        logger.info("ShotGrid client connection successful")
+    except Exception as e:
+        # Not fatal: the first request will connect on its own
+        logger.warning("ShotGrid warm-up failed: %s", e)
+
+# Warm up in the background while the rest of the module loads; _dispatch waits
+# for it before touching the client, which is not thread-safe.
+_WARMUP = threading.Thread(target=_warm_up, name="shotgrid-warmup", daemon=True)
+_WARMUP.start()
+
 # ─────────────────────────────── ShotGrid helper ────────────────────────────
+# Shared fallback for optional link fields; only ever read from, never mutated.
+_EMPTY: Dict[str, Any] = {}
+
+# ShotGrid often fires several webhooks for the same Task within seconds; keep
+# its links around just long enough to collapse those bursts.
+_FIND_CACHE_SIZE = 512
+_FIND_CACHE_TTL_SECS = 5
+
 class SG:
     """Lightweight wrapper re‑using one persistent ShotGrid session."""
-    def __init__(self):
-        self._sg = _SG_CLIENT
+    def __init__(self, client: shotgun_api3.Shotgun):
+        self._sg = client
+        # Task id -> link fields. Statuses are never cached: other services and
+        # manual edits change them without any way to evict this container's copy.
+        self._task_links = TTLCache(maxsize=_FIND_CACHE_SIZE, ttl=_FIND_CACHE_TTL_SECS)
 
     # Queries
-    def find_version(self, vid: int):
-        logger.info(f"Finding Version {vid}")
+    def find_task(self, tid: int):
+        """Fetch a Task's step and entity links, without its status."""
+        cached = self._task_links.get(tid)
+        if cached is not None:
+            logger.info("Found Task %s links in cache", tid)
+            return cached
+        logger.info("Finding Task %s links", tid)
         try:
             result = self._sg.find_one(
-                "Version", [["id", "is", vid]],
-                ["id", "sg_task", "sg_status_list", "entity", "project"],
+                "Task", [["id", "is", tid]], ["id", "step", "entity", "project"],
             )
             if result:
-                logger.info(f"Found Version {vid} with status {result.get('sg_status_list')}")
-                task_id = (result.get("sg_task") or {}).get("id")
-                logger.info(f"Version {vid} is linked to Task {task_id}" if task_id else f"Version {vid} has no linked Task")
+                self._task_links[tid] = result
+                step_name = (result.get("step") or _EMPTY).get("name")
+                logger.info("Found Task %s with step %s", tid, step_name)
             else:
-                logger.warning(f"Version {vid} not found")
+                logger.warning("Task %s not found", tid)
             return result
-        except Exception as e:
-            logger.error(f"Error finding Version {vid}: {str(e)}")
+        except Exception:
+            logger.exception("Error finding Task %s", tid)
             return None
 
-    def find_task(self, tid: int):
-        logger.info(f"Finding Task {tid}")
+    def find_shot(self, sid: int):
+        logger.info("Finding Shot %s", sid)
         try:
             result = self._sg.find_one(
-                "Task", [["id", "is", tid]],
-                ["id", "step", "sg_status_list", "entity", "project"],
+                "Shot", [["id", "is", sid]], ["id", "sg_status_list", "code"],
             )
             if result:
-                step_name = (result.get("step") or {}).get("name")
-                logger.info(f"Found Task {tid} with status {result.get('sg_status_list')} and step {step_name}")
+                logger.info("Found Shot %s (%s) with status %s", sid, result.get("code"), result.get("sg_status_list"))
             else:
-                logger.warning(f"Task {tid} not found")
+                logger.warning("Shot %s not found", sid)
             return result
-        except Exception as e:
-            logger.error(f"Error finding Task {tid}: {str(e)}")
+        except Exception:
+            logger.exception("Error finding Shot %s", sid)
             return None
 
-    def find_shot(self, sid: int):
-        logger.info(f"Finding Shot {sid}")
+    def find_version_with_task_and_shot(self, vid: int):
+        """Fetch a Version, its Task and the Task's Shot in one deep-linked query.
+
+        Returns ``(version, task, shot)``; ``task``/``shot`` are ``None`` when the
+        Version has no Task or the Task is not linked to a Shot.
+        """
+        logger.info("Finding Version %s with linked Task and Shot", vid)
         try:
             result = self._sg.find_one(
-                "Shot", [["id", "is", sid]], ["id", "sg_status_list", "code"],
+                "Version", [["id", "is", vid]],
+                ["id", "sg_task", "sg_status_list", "entity", "project",
+                 "sg_task.Task.step", "sg_task.Task.sg_status_list", "sg_task.Task.entity",
+                 "sg_task.Task.entity.Shot.sg_status_list", "sg_task.Task.entity.Shot.code"],
             )
-            if result:
-                logger.info(f"Found Shot {sid} ({result.get('code')}) with status {result.get('sg_status_list')}")
-            else:
-                logger.warning(f"Shot {sid} not found")
-            return result
-        except Exception as e:
-            logger.error(f"Error finding Shot {sid}: {str(e)}")
-            return None
+        except Exception:
+            logger.exception("Error finding Version %s", vid)
+            return None, None, None
+
+        if not result:
+            logger.warning("Version %s not found", vid)
+            return None, None, None
+        logger.info("Found Version %s with status %s", vid, result.get("sg_status_list"))
+
+        task_id = (result.get("sg_task") or _EMPTY).get("id")
+        if not task_id:
+            logger.info("Version %s has no linked Task", vid)
+            return result, None, None
+
+        task = {
+            "type": "Task",
+            "id": task_id,
+            "step": result.get("sg_task.Task.step"),
+            "sg_status_list": result.get("sg_task.Task.sg_status_list"),
+            "entity": result.get("sg_task.Task.entity"),
+            "project": result.get("project"),
+        }
+        step_name = (task["step"] or _EMPTY).get("name")
+        logger.info("Version %s is linked to Task %s with status %s and step %s", vid, task_id, task["sg_status_list"], step_name)
+
+        entity = task["entity"] or _EMPTY
+        if entity.get("type") != "Shot":
+            return result, task, None
+
+        shot = {
+            "type": "Shot",
+            "id": entity.get("id"),
+            "sg_status_list": result.get("sg_task.Task.entity.Shot.sg_status_list"),
+            "code": result.get("sg_task.Task.entity.Shot.code"),
+        }
+        logger.info("Task %s is linked to Shot %s (%s) with status %s", task_id, shot["id"], shot["code"], shot["sg_status_list"])
+        return result, task, shot
 
     # Mutations
     def set_task_status(self, ids: List[int], status: str):
-        logger.info(f"Setting Task status to {status} for IDs: {ids}")
+        logger.info("Setting Task status to %s for IDs: %s", status, ids)
         try:
             batch = [
                 {"request_type": "update", "entity_type": "Task", "entity_id": tid,
                 "data": {"sg_status_list": status}} for tid in ids
             ]
             result = self._sg.batch(batch)
-            logger.info(f"Task status update successful: {result}")
+            logger.info("Task status update successful: %s", result)
             return result
-        except Exception as e:
-            logger.error(f"Error updating Task statuses: {str(e)}")
+        except Exception:
+            logger.exception("Error updating Task statuses")
             return None
 
     def set_shot_status(self, sid: int, status: str):
-        logger.info(f"Setting Shot {sid} status to {status}")
+        logger.info("Setting Shot %s status to %s", sid, status)
         try:
             result = self._sg.update("Shot", sid, {"sg_status_list": status})
-            logger.info(f"Shot {sid} status update successful: {result}")
+            logger.info("Shot %s status update successful: %s", sid, result)
             return result
-        except Exception as e:
-            logger.error(f"Error updating Shot {sid} status: {str(e)}")
+        except Exception:
+            logger.exception("Error updating Shot %s status", sid)
             return None
 
     def set_version_status(self, vid: int, status: str):
-        logger.info(f"Setting Version {vid} status to {status}")
+        logger.info("Setting Version %s status to %s", vid, status)
         try:
             result = self._sg.update("Version", vid, {"sg_status_list": status})
-            logger.info(f"Version {vid} status update successful: {result}")
+            logger.info("Version %s status update successful: %s", vid, result)
             return result
-        except Exception as e:
-            logger.error(f"Error updating Version {vid} status: {str(e)}")
+        except Exception:
+            logger.exception("Error updating Version %s status", vid)
             return None
 
-# ─────────────────────────────── YAML mappings ──────────────────────────────
-_V2T: Dict[str, List[str]] = _MAP.get("version_to_task", {})
-_T2S: Dict[str, List[str]] = _MAP.get("task_to_shot", {})
-logger.info(f"Loaded version-to-task mappings: {json.dumps(_V2T)}")
-logger.info(f"Loaded task-to-shot mappings: {json.dumps(_T2S)}")
+# One wrapper per container, shared by every invocation it serves.
+_SG = SG(_SG_CLIENT)
 
-map_version_to_task = lambda v: _V2T.get(v, [])
-map_task_to_shot   = lambda t: _T2S.get(t, [])
+# ─────────────────────────────── Status mappings ────────────────────────────
+# Frozen as tuples: immutable, and call sites read them with a plain dict.get.
+_NO_STATUSES: Tuple[str, ...] = ()
+_V2T: Dict[str, Tuple[str, ...]] = {k: tuple(v) for k, v in (_MAP.get("version_to_task") or {}).items()}
+_T2S: Dict[str, Tuple[str, ...]] = {k: tuple(v) for k, v in (_MAP.get("task_to_shot") or {}).items()}
+if logger.isEnabledFor(logging.INFO):
+    logger.info("Loaded version-to-task mappings: %s", json.dumps(_V2T))
+    logger.info("Loaded task-to-shot mappings: %s", json.dumps(_T2S))
 
 # ─────────────────────────────── Helper utils ───────────────────────────────
 
+def _log_sha_acceleration():
+    """Report once whether OpenSSL can use the CPU's SHA extensions for HMAC."""
+    try:
+        with open("/proc/cpuinfo", "rt") as f:
+            for line in f:
+                if line.startswith("flags"):
+                    logger.info("CPU SHA extensions (sha_ni) available: %s", "sha_ni" in line.split())
+                    return
+    except OSError:
+        pass
+    logger.info("CPU SHA extensions (sha_ni) available: unknown")
+
+_log_sha_acceleration()
+
+
 def _verify_sig(body: bytes, sig: Optional[str]) -> bool:
-    logger.info("Verifying webhook signature")
+    logger.debug("Verifying webhook signature")
     if not sig:
         logger.warning("No signature provided in request")
         return False
     sig = sig[5:] if sig.startswith("sha1=") else sig
-    expected = hmac.new(SECRET_TOKEN, body, hashlib.sha1).hexdigest()
-    result = hmac.compare_digest(expected, sig)
+    try:
+        sig_bytes = bytes.fromhex(sig)
+    except ValueError:
+        logger.warning("Signature is not valid hex")
+        return False
+    # hmac.digest takes OpenSSL's one-shot C path; compare raw digests so the
+    # expected side is never hex-encoded.
+    result = hmac.compare_digest(hmac.digest(SECRET_TOKEN, body, "sha1"), sig_bytes)
     if result:
-        logger.info("Signature verification successful")
+        logger.debug("Signature verification successful")
     else:
         logger.warning("Signature verification failed")
     return result
 
 
 def _entity_id(data: dict) -> Optional[int]:
-    logger.info("Extracting entity ID from payload")
+    logger.debug("Extracting entity ID from payload")
     entity_id = None
     if "entity_id" in data:
         entity_id = data["entity_id"]
-        logger.info(f"Found entity_id: {entity_id}")
+        logger.debug("Found entity_id: %s", entity_id)
     else:
         ent = data.get("entity")
         if isinstance(ent, dict):
             entity_id = ent.get("id")
-            logger.info(f"Found entity.id: {entity_id}")
+            logger.debug("Found entity.id: %s", entity_id)
 
     if entity_id is None:
         logger.warning("No entity ID found in payload")
@@ -202,56 +350,69 @@ def _entity_id(data: dict) -> Optional[int]:
     return entity_id
 
 
+_COMPOSITE_STEPS = frozenset(("Composite", "Secondary Composite"))
+
+
+def _epoch_secs(ts: str) -> float:
+    """Seconds since the epoch for a ShotGrid ``YYYY-MM-DDTHH:MM:SS[.fff]Z`` timestamp."""
+    if len(ts) >= 20 and ts[10] == "T" and ts.endswith("Z"):
+        secs = calendar.timegm((int(ts[0:4]), int(ts[5:7]), int(ts[8:10]),
+                                int(ts[11:13]), int(ts[14:16]), int(ts[17:19]), 0, 0, 0))
+        frac = ts[19:-1]
+        return secs + float(frac) if frac else secs
+    return datetime.fromisoformat(ts.replace("Z", "+00:00")).timestamp()
+
+
 def _is_composite_step(task: dict) -> bool:
-    step = (task or {}).get("step") or {}
-    step_name = step.get("name")
-    result = step_name in {"Composite", "Secondary Composite"}
-    logger.info(f"Checking if step '{step_name}' is composite: {result}")
+    step = task.get("step")
+    result = bool(step) and step.get("name") in _COMPOSITE_STEPS
+    logger.debug("Checking if step %r is composite: %s", step and step.get("name"), result)
     return result
 
 
-def _update_linked_shot_if_needed(sg: SG, task: dict, candidate: List[str]):
-    logger.info(f"Checking if linked Shot needs status update to one of: {candidate}")
+def _update_linked_shot_if_needed(sg: SG, task: dict, candidate: Tuple[str, ...], shot: Optional[dict] = None):
+    logger.debug("Checking if linked Shot needs status update to one of: %s", candidate)
 
     if not candidate:
-        logger.info("No candidate statuses provided for Shot, skipping")
+        logger.debug("No candidate statuses provided for Shot, skipping")
         return None, None
 
-    if "entity" not in task:
-        logger.info("Task has no linked entity, skipping")
+    entity = task.get("entity")
+    if not entity:
+        logger.debug("Task has no linked entity, skipping")
         return None, None
 
-    shot_id = task["entity"].get("id")
+    shot_id = entity.get("id")
     if not shot_id:
-        logger.info("Task's linked entity has no ID, skipping")
+        logger.debug("Task's linked entity has no ID, skipping")
         return None, None
 
-    shot = sg.find_shot(shot_id)
+    if shot is None or shot.get("id") != shot_id:
+        shot = sg.find_shot(shot_id)
     if not shot:
-        logger.warning(f"Linked Shot {shot_id} not found")
+        logger.warning("Linked Shot %s not found", shot_id)
         return None, None
 
     current_status = shot["sg_status_list"]
     if current_status in candidate:
-        logger.info(f"Shot {shot_id} already has status '{current_status}' which is in candidate list, skipping update")
+        logger.debug("Shot %s already has status '%s' which is in candidate list, skipping update", shot_id, current_status)
         return shot, None
 
-    logger.info(f"Updating Shot {shot_id} status from '{current_status}' to '{candidate[0]}'")
     result = sg.set_shot_status(shot_id, candidate[0])
     return shot, result
 
 # ─────────────────────────────── Handlers ───────────────────────────────────
 
 def _handle_version_status(payload: dict):
-    logger.info("Version status webhook triggered")
+    logger.debug("Version status webhook triggered")
     # Use debug level for large payloads
-    logger.debug(f"Version status payload: {json.dumps(payload)}")
+    logger.debug("Version status payload: %s", payload)
 
     meta = payload["data"].get("meta", {})
     attribute_name = meta.get("attribute_name")
 
     if attribute_name != "sg_status_list":
-        logger.info(f"Ignoring update to attribute '{attribute_name}', only handling sg_status_list")
+        logger.info("Ignoring update to attribute '%s', only handling sg_status_list", attribute_name)
         return {"ignored": True, "reason": f"attribute_name is '{attribute_name}', not 'sg_status_list'"}
 
     vid = _entity_id(payload["data"])
@@ -261,52 +422,44 @@ def _handle_version_status(payload: dict):
 
     new_status = meta.get("new_value")
     old_status = meta.get("old_value")
-    logger.info(f"Version {vid} status changed from '{old_status}' to '{new_status}'")
+    logger.info("Version %s status changed from '%s' to '%s'", vid, old_status, new_status)
 
-    sg = SG()
-    version = sg.find_version(vid) or {}
+    sg = _SG
+    _version, task, shot = sg.find_version_with_task_and_shot(vid)
+    task_id = task["id"] if task else None
+    current_task_status = task["sg_status_list"] if task else None
 
-    task_id = (version.get("sg_task") or {}).get("id")
-    logger.info(f"Version {vid} is linked to Task {task_id}" if task_id else f"Version {vid} has no linked Task")
+    task_statuses = _V2T.get(new_status, _NO_STATUSES)
+    logger.debug("Mapped Version status '%s' to Task statuses: %s", new_status, task_statuses)
 
-    task = sg.find_task(task_id) if task_id else None
-
-    task_statuses = map_version_to_task(new_status)
-    logger.info(f"Mapped Version status '{new_status}' to Task statuses: {task_statuses}")
-
-    if task and task_statuses and task["sg_status_list"] not in task_statuses:
-        current_task_status = task["sg_status_list"]
+    if task and task_statuses and current_task_status not in task_statuses:
         target_task_status = task_statuses[0]
-        logger.info(f"Updating Task {task_id} status from '{current_task_status}' to '{target_task_status}'")
-
         sg.set_task_status([task_id], target_task_status)
 
-        shot_statuses = map_task_to_shot(target_task_status)
-        logger.info(f"Mapped Task status '{target_task_status}' to Shot statuses: {shot_statuses}")
+        shot_statuses = _T2S.get(target_task_status, _NO_STATUSES)
+        logger.debug("Mapped Task status '%s' to Shot statuses: %s", target_task_status, shot_statuses)
 
-        shot_before, shot_update = _update_linked_shot_if_needed(sg, task, shot_statuses)
-        if shot_update:
-            logger.info(f"Updated linked Shot from '{shot_before['sg_status_list']}' to '{shot_update['sg_status_list']}'")
+        _update_linked_shot_if_needed(sg, task, shot_statuses, shot)
     else:
         if not task:
-            logger.info(f"No Task found for Task ID {task_id}, skipping Task update")
+            logger.debug("No Task found for Task ID %s, skipping Task update", task_id)
         elif not task_statuses:
-            logger.info(f"No mapped Task statuses for Version status '{new_status}', skipping Task update")
+            logger.debug("No mapped Task statuses for Version status '%s', skipping Task update", new_status)
         else:
-            logger.info(f"Task {task_id} already has status '{task['sg_status_list']}' which matches mapping, skipping update")
+            logger.debug("Task %s already has status '%s' which matches mapping, skipping update", task_id, current_task_status)
 
     return {"version_id": vid, "task_id": task_id, "new_status": new_status}
 
 
 def _handle_task_status(payload: dict):
-    logger.info("Task status webhook triggered")
-    logger.debug(f"Task status payload: {json.dumps(payload)}")
+    logger.debug("Task status webhook triggered")
+    logger.debug("Task status payload: %s", payload)
 
     meta = payload["data"].get("meta", {})
     attribute_name = meta.get("attribute_name")
 
     if attribute_name != "sg_status_list":
-        logger.info(f"Ignoring update to attribute '{attribute_name}', only handling sg_status_list")
+        logger.info("Ignoring update to attribute '%s', only handling sg_status_list", attribute_name)
         return {"ignored": True, "reason": f"attribute_name is '{attribute_name}', not 'sg_status_list'"}
 
     tid = _entity_id(payload["data"])
@@ -316,122 +469,101 @@ def _handle_task_status(payload: dict):
 
     new_status = meta.get("new_value")
     old_status = meta.get("old_value")
-    logger.info(f"Task {tid} status changed from '{old_status}' to '{new_status}'")
+    logger.info("Task %s status changed from '%s' to '%s'", tid, old_status, new_status)
 
-    sg = SG()
+    sg = _SG
     task = sg.find_task(tid)
 
     if not task:
-        logger.error(f"Task {tid} not found")
+        logger.error("Task %s not found", tid)
         return {"error": f"Task {tid} not found"}
 
     if not _is_composite_step(task):
-        logger.info(f"Task {tid} is not in a Composite step, ignoring")
+        logger.debug("Task %s is not in a Composite step, ignoring", tid)
         return {"ignored": True, "reason": "Not a composite step task"}
 
-    shot_statuses = map_task_to_shot(new_status)
-    logger.info(f"Mapped Task status '{new_status}' to Shot statuses: {shot_statuses}")
+    shot_statuses = _T2S.get(new_status, _NO_STATUSES)
+    logger.debug("Mapped Task status '%s' to Shot statuses: %s", new_status, shot_statuses)
 
     shot_before, shot_update = _update_linked_shot_if_needed(sg, task, shot_statuses)
+    before_status = shot_before["sg_status_list"] if shot_before else None
+    after_status = shot_update["sg_status_list"] if shot_update else None
 
-    if shot_update:
-        before_status = shot_before["sg_status_list"] if shot_before else None
-        after_status = shot_update["sg_status_list"] if shot_update else None
-        logger.info(f"Updated linked Shot from '{before_status}' to '{after_status}'")
-    else:
-        logger.info("No Shot update performed")
+    if not shot_update:
+        logger.debug("No Shot update performed")
 
     return {
         "task_id": tid,
         "new_status": new_status,
-        "shot_before": shot_before["sg_status_list"] if shot_before else None,
-        "shot_after": shot_update["sg_status_list"] if shot_update else None
+        "shot_before": before_status,
+        "shot_after": after_status
     }
 
 
+# Only specific pipeline steps should get 'cnv' status on new Versions
+_CNV_STEPS = frozenset(("Prep", "Composite", "Computer Graphics"))
+
+
 def _handle_version_created(payload: dict):
     """Set new Versions to status `cnv` only for Prep, Composite, or Computer Graphics steps."""
-    logger.info("Version created webhook triggered")
-    logger.debug(f"Version created payload: {json.dumps(payload)}")
+    logger.debug("Version created webhook triggered")
+    logger.debug("Version created payload: %s", payload)
 
     vid = _entity_id(payload["data"])
     if vid is None:
         logger.error("Failed to extract entity ID from payload")
         return {"error": "No entity id"}
 
-    sg = SG()
-    version = sg.find_version(vid)
+    sg = _SG
+    version, task, shot = sg.find_version_with_task_and_shot(vid)
 
     if not version:
-        logger.error(f"Version {vid} not found")
+        logger.error("Version %s not found", vid)
         return {"error": f"Version {vid} not found"}
 
     status_before = version["sg_status_list"]
-    logger.info(f"New Version {vid} initial status: '{status_before}'")
-
-    step_name = None
-    task = None
-    task_id = None
 
-    if version.get("sg_task"):
-        task_id = version["sg_task"]["id"]
-        logger.info(f"Version {vid} is linked to Task {task_id}")
+    task = task or _EMPTY
+    task_id = task.get("id")
+    current_task_status = task.get("sg_status_list")
+    step_name = (task.get("step") or _EMPTY).get("name")
 
-        task = sg.find_task(task_id)
-        if task:
-            step_name = (task.get("step") or {}).get("name")
-            logger.info(f"Task {task_id} is in step '{step_name}' with status '{task.get('sg_status_list')}'")
-        else:
-            logger.warning(f"Failed to fetch Task {task_id} details")
-    else:
-        logger.info(f"Version {vid} has no linked Task")
-
-    # Only specific pipeline steps should get 'cnv' status
-    eligible_steps = ["Prep", "Composite", "Computer Graphics"]
-
-    if step_name in eligible_steps:
-        logger.info(f"Setting Version {vid} status from '{status_before}' to 'cnv' (in eligible step: {step_name})")
+    if step_name in _CNV_STEPS:
+        logger.debug("Setting Version %s status from '%s' to 'cnv' (in eligible step: %s)", vid, status_before, step_name)
         sg.set_version_status(vid, "cnv")
         status_after = "cnv"
 
         # Propagate the status to tasks
-        task_statuses = map_version_to_task("cnv")
-        logger.info(f"Mapped Version status 'cnv' to Task statuses: {task_statuses}")
+        task_statuses = _V2T.get("cnv", _NO_STATUSES)
+        logger.debug("Mapped Version status 'cnv' to Task statuses: %s", task_statuses)
 
-        if task and task_statuses and task["sg_status_list"] not in task_statuses:
-            current_task_status = task["sg_status_list"]
+        if task and task_statuses and current_task_status not in task_statuses:
             target_task_status = task_statuses[0]
-            logger.info(f"Updating Task {task_id} status from '{current_task_status}' to '{target_task_status}'")
-
             sg.set_task_status([task_id], target_task_status)
 
-            shot_statuses = map_task_to_shot(target_task_status)
-            logger.info(f"Mapped Task status '{target_task_status}' to Shot statuses: {shot_statuses}")
+            shot_statuses = _T2S.get(target_task_status, _NO_STATUSES)
+            logger.debug("Mapped Task status '%s' to Shot statuses: %s", target_task_status, shot_statuses)
 
-            shot_before, shot_update = _update_linked_shot_if_needed(sg, task, shot_statuses)
-            if shot_update:
-                before_status = shot_before["sg_status_list"] if shot_before else None
-                after_status = shot_update["sg_status_list"] if shot_update else None
-                logger.info(f"Updated linked Shot from '{before_status}' to '{after_status}'")
+            _update_linked_shot_if_needed(sg, task, shot_statuses, shot)
         else:
             if not task:
-                logger.info(f"No Task found for Task ID {task_id}, skipping Task update")
+                logger.debug("No Task found for Task ID %s, skipping Task update", task_id)
             elif not task_statuses:
-                logger.info(f"No mapped Task statuses for Version status 'cnv', skipping Task update")
+                logger.debug("No mapped Task statuses for Version status 'cnv', skipping Task update")
             else:
-                logger.info(f"Task {task_id} already has status '{task['sg_status_list']}' which matches mapping, skipping update")
+                logger.debug("Task %s already has status '%s' which matches mapping, skipping update", task_id, current_task_status)
     else:
         # Set to 'na' if not in eligible steps and not already 'na'
-        if step_name not in eligible_steps and status_before != "na":
-            logger.info(f"Setting Version {vid} status from '{status_before}' to 'na' (not in eligible step)")
+        if step_name not in _CNV_STEPS and status_before != "na":
+            logger.debug("Setting Version %s status from '%s' to 'na' (not in eligible step)", vid, status_before)
             sg.set_version_status(vid, "na")
             status_after = "na"
         else:
             status_after = status_before
-            if step_name in eligible_steps:
-                logger.info(f"Version {vid} already has status 'cnv', no update needed")
+            if step_name in _CNV_STEPS:
+                logger.debug("Version %s already has status 'cnv', no update needed", vid)
             else:
-                logger.info(f"Version {vid} already has status 'na', no update needed")
+                logger.debug("Version %s already has status 'na', no update needed", vid)
 
     return {
         "version_id": vid,
@@ -443,70 +575,99 @@ def _handle_version_created(payload: dict):
 
 # ─────────────────────────────── Dispatcher ────────────────────────────────
 
+_ROUTES = {
+    "task":            _handle_task_status,
+    "version":         _handle_version_status,
+    "status":          _handle_version_status,
+    "version_created": _handle_version_created,
+    "version-created": _handle_version_created,
+}
+_STATUS_HANDLERS = frozenset((_handle_task_status, _handle_version_status))
+
+def _json_response(result: dict, status: int = 200) -> Response:
+    return make_response(orjson.dumps(result), status, {"Content-Type": "application/json"})
+
+
 def _dispatch(request: Request, route: Optional[str] = None):
     path = request.path
     key = (route or path.rstrip("/").split("/")[-1]).lower()
-    logger.info(f"Received webhook request to path '{path}', dispatching as '{key}'")
+    logger.info("Received webhook request to path '%s', dispatching as '%s'", path, key)
 
-    body_data = request.get_data()
-    logger.debug(f"Request body size: {len(body_data)} bytes")
+    # The raw body is read exactly once: it feeds both the signature check and
+    # the JSON parse, so Flask has no reason to keep its own cached copy.
+    body_data = request.get_data(cache=False)
+    logger.debug("Request body size: %s bytes", len(body_data))
 
     sig = request.headers.get("X-SG-Signature")
     if not _verify_sig(body_data, sig):
-        logger.warning(f"Unauthorized request to {path}: Invalid signature")
+        logger.warning("Unauthorized request to %s: Invalid signature", path)
         abort(make_response(("Unauthorized", 401)))
 
+    handler = _ROUTES.get(key)
+    if handler is None:
+        logger.warning("Unknown webhook type: %s", key)
+        abort(make_response(("Not Found", 404)))
+
+    # Status handlers only act on sg_status_list changes. Event-log webhooks fire
+    # for every attribute, so drop the others before paying for a full parse.
+    if (handler in _STATUS_HANDLERS and b'"attribute_name"' in body_data
+            and b'"sg_status_list"' not in body_data):
+        logger.info("Ignoring non sg_status_list update for '%s'", key)
+        return _json_response({"ignored": True, "reason": "attribute_name is not 'sg_status_list'"})
+
+    _WARMUP.join()
+
     try:
-        payload = request.get_json(force=True)
-        logger.debug(f"Parsed JSON payload type: {payload.get('event_type', 'unknown')}")
+        payload = orjson.loads(body_data)
+        logger.debug("Parsed JSON payload type: %s", payload.get("event_type", "unknown"))
     except Exception as e:
-        logger.error(f"Failed to parse JSON from request: {str(e)}")
+        logger.error("Failed to parse JSON from request: %s", e)
         abort(make_response(("Bad JSON", 400)))
 
-    if key == "task":
-        logger.info("Handling as task webhook")
-        result = _handle_task_status(payload)
-    elif key in {"version", "status"}:
-        logger.info("Handling as version status webhook")
-        result = _handle_version_status(payload)
-    elif key in {"version_created", "version-created"}:
-        logger.info("Handling as version created webhook")
-        result = _handle_version_created(payload)
-    else:
-        logger.warning(f"Unknown webhook type: {key}")
-        abort(make_response(("Not Found", 404)))
+    logger.debug("Handling with %s", handler.__name__)
+    result = handler(payload)
 
     ts = payload.get("timestamp")
     if ts:
         try:
-            ts_dt = datetime.fromisoformat(ts.replace("Z", "+00:00"))
-            lag_ms = int((datetime.now(timezone.utc) - ts_dt).total_seconds()*1000)
+            lag_ms = int((time.time() - _epoch_secs(ts)) * 1000)
             result["lag_ms"] = lag_ms
-            logger.info(f"Event processing lag: {lag_ms}ms")
+            logger.info("Event processing lag: %sms", lag_ms)
         except Exception as e:
-            logger.warning(f"Bad timestamp '{ts}': {str(e)}")
+            logger.warning("Bad timestamp '%s': %s", ts, e)
 
-    logger.info(f"Webhook {key} processing complete: {json.dumps(result)}")
-    return jsonify(result), 200
+    logger.info("Webhook %s processing complete: %s", key, result)
+    return _json_response(result)
 
 # ─────────────────────────────── Cloud Function exports ────────────────────
-@https_fn.on_request()
+# Keep one instance of each function warm so webhooks never wait on a cold
+# start; this is billed while idle, so lower min_instances to 0 if latency
+# matters less than cost. The extra memory also buys a larger CPU share for the
+# ShotGrid client init. The shared ShotGrid client is not thread-safe, so each
+# instance serves one request at a time.
+_HTTP_OPTS = dict(
+    min_instances=1,
+    concurrency=1,
+    memory=options.MemoryOption.MB_512,
+)
+
+@https_fn.on_request(**_HTTP_OPTS)
 def task_webhook(request: Request):
-    logger.info("task_webhook function called")
+    logger.debug("task_webhook function called")
     return _dispatch(request, "task")
 
-@https_fn.on_request()
+@https_fn.on_request(**_HTTP_OPTS)
 def version_webhook(request: Request):
-    logger.info("version_webhook function called")
+    logger.debug("version_webhook function called")
     return _dispatch(request, "version")
 
-@https_fn.on_request()
+@https_fn.on_request(**_HTTP_OPTS)
 def version_created_webhook(request: Request):
-    logger.info("version_created_webhook function called")
+    logger.debug("version_created_webhook function called")
     return _dispatch(request, "version_created")
 
 # Local testing entrypoint
 @functions_framework.http
 def main(request: Request):
-    logger.info("main function called (local development)")
+    logger.debug("main function called (local development)")
     return _dispatch(request)